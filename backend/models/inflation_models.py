@@ -1,26 +1,32 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional
-from datetime import datetime
+import msgspec
+from pydantic import BaseModel
+from typing import Annotated, Optional
+from datetime import date
 
-class InflationRequest(BaseModel):
-    start_date: str = Field(..., description="Employment start date in YYYY-MM-DD format")
-    original_salary: float = Field(..., gt=0, description="Original annual salary in USD")
+# First date covered by BLS CPI data
+_CPI_START_DATE = date(1913, 1, 1)
+
+class InflationRequest(msgspec.Struct):
+    """Request body for /calculate-inflation, decoded and validated in one pass by msgspec"""
+    # Decoded straight to a date by msgspec, which only accepts YYYY-MM-DD strings
+    start_date: Annotated[date, msgspec.Meta(description="Employment start date in YYYY-MM-DD format")]
+    original_salary: Annotated[float, msgspec.Meta(gt=0, description="Original annual salary in USD")]
     
-    @validator('start_date')
-    def validate_date(cls, v):
-        try:
-            date_obj = datetime.strptime(v, '%Y-%m-%d')
-            # Ensure date is not in the future
-            if date_obj > datetime.now():
-                raise ValueError('Start date cannot be in the future')
-            # Ensure date is not before 1913 (when CPI data starts)
-            if date_obj.year < 1913:
-                raise ValueError('Start date cannot be before 1913 (CPI data not available)')
-            return v
-        except ValueError as e:
-            if "does not match format" in str(e):
-                raise ValueError('Date must be in YYYY-MM-DD format')
-            raise e
+    def __post_init__(self):
+        # ValueErrors raised here surface as msgspec.ValidationError from decode()
+        # Ensure date is not before 1913 (when CPI data starts)
+        if self.start_date < _CPI_START_DATE:
+            raise ValueError('Start date cannot be before 1913 (CPI data not available)')
+        # Ensure date is not in the future
+        if self.start_date > date.today():
+            raise ValueError('Start date cannot be in the future')
+
+# Upper bound on items per /calculate-inflation/batch request
+MAX_BATCH_SIZE = 100
+
+class InflationBatchRequest(msgspec.Struct):
+    """Request body for /calculate-inflation/batch"""
+    items: Annotated[list[InflationRequest], msgspec.Meta(min_length=1, max_length=MAX_BATCH_SIZE)]
 
 class InflationResponse(BaseModel):
     original_salary: float
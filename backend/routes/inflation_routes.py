@@ -1,14 +1,45 @@
-from fastapi import APIRouter, HTTPException
-from models.inflation_models import InflationRequest, InflationResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from models.inflation_models import InflationRequest, InflationBatchRequest, InflationResponse, MAX_BATCH_SIZE
 from services.salary_calculator import SalaryCalculator
+import msgspec
 import logging
+from typing import List
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 calculator = SalaryCalculator()
 
-@router.post("/calculate-inflation", response_model=InflationResponse)
-async def calculate_inflation(request: InflationRequest):
+# Request bodies are decoded by msgspec rather than FastAPI, so publish their
+# schemas to OpenAPI by hand.
+_, _request_schemas = msgspec.json.schema_components([InflationRequest])
+_batch_request_schema = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": _request_schemas["InflationRequest"],
+            "minItems": 1,
+            "maxItems": MAX_BATCH_SIZE,
+        }
+    },
+    "required": ["items"],
+}
+
+# The response is serialized straight from the calculator's output with orjson;
+# InflationResponse is kept in `responses` so the OpenAPI schema is unchanged.
+@router.post(
+    "/calculate-inflation",
+    response_class=ORJSONResponse,
+    responses={200: {"model": InflationResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _request_schemas["InflationRequest"]}},
+        }
+    },
+)
+async def calculate_inflation(raw_request: Request):
     """
     Calculate inflation-adjusted salary based on employment start date and original salary.
     
@@ -17,13 +48,20 @@ async def calculate_inflation(request: InflationRequest):
     - 1991-2021: COLA calculations with de facto pay cut analysis  
     - Post-2021: Simple inflation adjustment using CPI data
     """
+    try:
+        request = msgspec.json.decode(await raw_request.body(), type=InflationRequest)
+    except msgspec.DecodeError as e:
+        # Covers both malformed JSON and msgspec.ValidationError
+        logger.warning(f"Invalid request body for inflation calculation: {str(e)}")
+        raise HTTPException(status_code=422, detail=str(e))
+    
     try:
         logger.info(f"Processing inflation calculation for date: {request.start_date}, salary: ${request.original_salary}")
         
         result = calculator.calculate_adjusted_salary(request)
         
         logger.info(f"Calculation completed successfully for {request.start_date}")
-        return result
+        return ORJSONResponse(result.model_dump())
         
     except ValueError as e:
         logger.warning(f"Invalid input for inflation calculation: {str(e)}")
@@ -34,4 +72,47 @@ async def calculate_inflation(request: InflationRequest):
         raise HTTPException(
             status_code=500, 
             detail="An error occurred while calculating inflation. Please try again later."
-        )
\ No newline at end of file
+        )
+
+@router.post(
+    "/calculate-inflation/batch",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[InflationResponse]}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _batch_request_schema}},
+        }
+    },
+)
+async def calculate_inflation_batch(raw_request: Request):
+    """
+    Calculate inflation-adjusted salaries for several start dates and salaries in one request.
+    
+    Accepts {"items": [...]} where each item has the same shape as a /calculate-inflation
+    request, and returns the results as a list in the same order.
+    """
+    try:
+        batch = msgspec.json.decode(await raw_request.body(), type=InflationBatchRequest)
+    except msgspec.DecodeError as e:
+        logger.warning(f"Invalid request body for batch inflation calculation: {str(e)}")
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    try:
+        logger.info(f"Processing batch inflation calculation for {len(batch.items)} items")
+        
+        results = [calculator.calculate_adjusted_salary(item).model_dump() for item in batch.items]
+        
+        logger.info(f"Batch calculation completed successfully for {len(batch.items)} items")
+        return ORJSONResponse(results)
+        
+    except ValueError as e:
+        logger.warning(f"Invalid input for batch inflation calculation: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in batch inflation calculation: {str(e)}")
+        raise HTTPException(
+            status_code=500, 
+            detail="An error occurred while calculating inflation. Please try again later."
+        )
@@ -1,17 +1,190 @@
+import asyncio
+import logging
 import requests
-import json
-import os
-from datetime import datetime
-from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+import orjson
+import numpy as np
+import bisect
+import pickle
+import threading
+import time
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Official BLS CPI-U values (1982-84=100) - Annual averages
+_FALLBACK_CPI = {
+    1913: 9.9, 1920: 20.0, 1930: 16.7, 1940: 14.0, 1950: 24.1,
+    1960: 29.6, 1970: 38.8, 1980: 82.4, 1990: 130.7, 1991: 136.2,
+    1995: 152.4, 2000: 172.2, 2005: 195.3, 2010: 218.1, 
+    2011: 224.9, 2012: 229.6, 2013: 233.0, 2014: 236.7, 2015: 237.0,
+    2016: 240.0, 2017: 245.1, 2018: 251.1, 2019: 255.7, 2020: 258.8, 
+    2021: 271.0, 2022: 292.7, 2023: 307.0, 2024: 315.6
+}
+_FALLBACK_YEARS = sorted(_FALLBACK_CPI)
+_FALLBACK_MIN = _FALLBACK_YEARS[0]
+_FALLBACK_MAX = _FALLBACK_YEARS[-1]
+# Assumed annual inflation when extrapolating before / after the table
+_BACKWARD_RATE = 1.03
+_FORWARD_RATE = 1.025
+
+# Official monthly CPI-U data for key periods (source: BLS); read-only
+_MONTHLY_CPI = MappingProxyType({
+    # 2014 monthly data
+    (2014, 1): 233.9, (2014, 2): 234.8, (2014, 3): 236.3, (2014, 4): 237.1,
+    (2014, 5): 237.9, (2014, 6): 238.3, (2014, 7): 238.3, (2014, 8): 237.9,
+    (2014, 9): 238.0, (2014, 10): 237.4, (2014, 11): 236.2, (2014, 12): 234.8,
+    
+    # 2024 monthly data  
+    (2024, 1): 308.4, (2024, 2): 310.3, (2024, 3): 312.2, (2024, 4): 313.5,
+    (2024, 5): 314.1, (2024, 6): 314.0, (2024, 7): 313.5, (2024, 8): 314.7,
+    (2024, 9): 315.3, (2024, 10): 315.6, (2024, 11): 315.2, (2024, 12): 315.6,
+})
+
+# Same table as parallel arrays for vectorized lookups
+_YEARS_ARR = np.array(_FALLBACK_YEARS, dtype=np.int32)
+_CPI_ARR = np.array([_FALLBACK_CPI[y] for y in _FALLBACK_YEARS], dtype=np.float64)
+
+# Cache lifetimes for BLS ranges (seconds)
+_CURRENT_RANGE_TTL = 3600
+_HISTORICAL_RANGE_TTL = 30 * 24 * 3600
+# Wait this long after a failed BLS fetch before trying that range again
+_FETCH_RETRY_BACKOFF = 300
+
+
+# CPI lookups below are pure functions of their arguments, so they live at module
+# level where lru_cache can memoize them without `self` being part of the key.
+
+def _interpolate_cpi(year: int) -> float:
+    """Interpolate CPI value for a given year"""
+    if year in _FALLBACK_CPI:
+        return _FALLBACK_CPI[year]
+    
+    if year < _FALLBACK_MIN:
+        # Extrapolate backwards (assume 3% inflation)
+        years_diff = _FALLBACK_MIN - year
+        return _FALLBACK_CPI[_FALLBACK_MIN] / (_BACKWARD_RATE ** years_diff)
+    
+    if year > _FALLBACK_MAX:
+        # Extrapolate forwards (assume 2.5% inflation)
+        years_diff = year - _FALLBACK_MAX
+        return _FALLBACK_CPI[_FALLBACK_MAX] * (_FORWARD_RATE ** years_diff)
+    
+    # Interpolate between two known years; bisect finds the interval in O(log n)
+    i = bisect.bisect_right(_FALLBACK_YEARS, year) - 1
+    y1, y2 = _FALLBACK_YEARS[i], _FALLBACK_YEARS[i + 1]
+    cpi1, cpi2 = _FALLBACK_CPI[y1], _FALLBACK_CPI[y2]
+    
+    # Linear interpolation
+    ratio = (year - y1) / (y2 - y1)
+    return cpi1 + ratio * (cpi2 - cpi1)
+
+
+def interpolate_cpi_batch(years: np.ndarray) -> np.ndarray:
+    """Vectorized _interpolate_cpi for many years at once, e.g. for batch requests"""
+    years = np.asarray(years)
+    cpi = np.interp(years, _YEARS_ARR, _CPI_ARR)
+    
+    # np.interp clamps outside the table, so apply the same extrapolation as the scalar path
+    cpi = np.where(years < _FALLBACK_MIN, _CPI_ARR[0] / (_BACKWARD_RATE ** (_FALLBACK_MIN - years)), cpi)
+    cpi = np.where(years > _FALLBACK_MAX, _CPI_ARR[-1] * (_FORWARD_RATE ** (years - _FALLBACK_MAX)), cpi)
+    return cpi
+
+
+def _index_cpi(cpi_data: Dict) -> Dict[int, float]:
+    """Map year -> annual average CPI (period M13) for a BLS API response"""
+    return {
+        int(d['year']): float(d['value'])
+        for d in cpi_data['Results']['series'][0]['data']
+        if d['period'] == 'M13'
+    }
+
+
+@lru_cache(maxsize=256)
+def _annual_cpi(year: int) -> Optional[float]:
+    """Get annual CPI for a specific year"""
+    if year in _FALLBACK_CPI:
+        return _FALLBACK_CPI[year]
+    
+    return _interpolate_cpi(year)
+
+
+@lru_cache(maxsize=1024)
+def _monthly_cpi(year: int, month: int) -> Optional[float]:
+    """Get CPI for specific month/year - more accurate than annual averages"""
+    # Check if we have exact monthly data
+    monthly = _MONTHLY_CPI.get((year, month))
+    if monthly is not None:
+        return monthly
+    
+    # Fall back to annual average and interpolate monthly
+    annual_cpi = _annual_cpi(year)
+    if annual_cpi:
+        # Simple monthly interpolation (could be enhanced further)
+        return annual_cpi
+        
+    return None
+
+
+def _compound_inflation(start_year: int, end_year: int) -> float:
+    """Calculate compound inflation rate between two years"""
+    start_cpi = _annual_cpi(start_year)
+    end_cpi = _annual_cpi(end_year)
+    
+    if start_cpi and end_cpi:
+        return (end_cpi - start_cpi) / start_cpi
+    
+    # Ultimate fallback - use historical average
+    years_diff = end_year - start_year
+    return 0.025 * years_diff  # 2.5% annual average
+
+
+@lru_cache(maxsize=1024)
+def _inflation_rate_for_month(start_year: int, start_month: int) -> tuple[float, int]:
+    """Total inflation rate and years elapsed from the given month to the latest CPI data"""
+    current_year = 2024  # Use current year
+    current_month = 12   # Use most recent data available
+    
+    years_elapsed = current_year - start_year
+    
+    # Get more precise CPI data
+    start_cpi = _monthly_cpi(start_year, start_month)
+    current_cpi = _monthly_cpi(current_year, current_month)
+    
+    # Calculate inflation rate using BLS methodology
+    if start_cpi and current_cpi:
+        inflation_rate = (current_cpi - start_cpi) / start_cpi
+    else:
+        # Enhanced fallback calculation
+        inflation_rate = _compound_inflation(start_year, current_year)
+        
+    return inflation_rate, years_elapsed
 
 class InflationService:
-    def __init__(self):
+    def __init__(self, data_dir: Optional[Path] = None):
         # BLS CPI-U Series ID for All Urban Consumers (1982-84=100)
         self.cpi_series_id = "CUUR0000SA0"
         self.bls_api_url = "https://api.bls.gov/publicAPI/v2/timeseries/data"
-        self.cache_file = Path(__file__).parent.parent / "data" / "cpi_cache.json"
+        self.cache_file = (data_dir or Path(__file__).parent.parent / "data") / "cpi_cache.pickle"
+        # JSON cache from before the binary format; migrated on first load
+        self.legacy_cache_file = self.cache_file.with_suffix('.json')
+        # Shared session so BLS calls reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.headers['Content-type'] = 'application/json'
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
         self.ensure_cache_dir()
+        # In-memory mirror of the on-disk cache; disk is only touched on new writes
+        self._cache = self.load_from_cache()
+        self._cache_lock = threading.Lock()
+        self._refreshing = set()
+        # {cache_key: time of the last failed BLS fetch}, for retry backoff
+        self._failed_at: Dict[str, float] = {}
+        # {cache_key: (cached BLS response, {year: annual CPI} built from it)}
+        self._cpi_index: Dict[str, Tuple[Dict, Dict[int, float]]] = {}
         
     def ensure_cache_dir(self):
         """Ensure the data directory exists for caching"""
@@ -20,74 +193,124 @@ class InflationService:
     def get_cpi_data(self, start_year: int, end_year: int) -> Dict:
         """Get CPI data from BLS API with caching"""
         cache_key = f"{start_year}_{end_year}"
-        cached_data = self.load_from_cache()
         
         # Check if we have cached data for this range
-        if cache_key in cached_data:
-            return cached_data[cache_key]
-            
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            if 'payload' not in entry:
+                # Entry cached before TTLs were tracked - serve it, but treat it as stale
+                entry = {'fetched_at': 0, 'ttl': 0, 'payload': entry}
+            # Stale-while-revalidate: never block the caller on BLS for a cached range
+            if time.time() - entry['fetched_at'] > entry['ttl'] and not self._in_backoff(cache_key):
+                self._schedule_refresh(start_year, end_year)
+            return entry['payload']
+        
+        if self._in_backoff(cache_key):
+            return self.get_fallback_cpi_data(start_year, end_year)
+        result = self._fetch_cpi_data(start_year, end_year)
+        if result is None:
+            # Return fallback historical averages if API fails
+            return self.get_fallback_cpi_data(start_year, end_year)
+        return result
+    
+    def _in_backoff(self, cache_key: str) -> bool:
+        """Whether a BLS fetch for this range failed too recently to retry"""
+        failed_at = self._failed_at.get(cache_key)
+        return failed_at is not None and time.time() - failed_at < _FETCH_RETRY_BACKOFF
+    
+    def _fetch_cpi_data(self, start_year: int, end_year: int) -> Optional[Dict]:
+        """Fetch a CPI range from the BLS API and cache it; returns None on failure"""
+        cache_key = f"{start_year}_{end_year}"
         try:
             # BLS API request
-            headers = {'Content-type': 'application/json'}
-            data = json.dumps({
+            data = orjson.dumps({
                 "seriesid": [self.cpi_series_id],
                 "startyear": str(start_year),
                 "endyear": str(end_year)
             })
             
-            response = requests.post(self.bls_api_url, data=data, headers=headers, timeout=10)
+            response = self._session.post(self.bls_api_url, data=data, timeout=10)
             response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             
             if result['status'] == 'REQUEST_SUCCEEDED':
                 # Cache the successful response
-                cached_data[cache_key] = result
-                self.save_to_cache(cached_data)
+                with self._cache_lock:
+                    self._cache[cache_key] = {
+                        'fetched_at': time.time(),
+                        'ttl': self._cache_ttl(end_year),
+                        'payload': result,
+                    }
+                    self._cpi_index.pop(cache_key, None)
+                    self._failed_at.pop(cache_key, None)
+                    self.save_to_cache(self._cache)
                 return result
             else:
                 raise Exception(f"BLS API error: {result.get('message', 'Unknown error')}")
                 
         except Exception as e:
-            print(f"Error fetching CPI data: {e}")
-            # Return fallback historical averages if API fails
-            return self.get_fallback_cpi_data(start_year, end_year)
+            logger.warning("Error fetching CPI data: %s", e)
+            with self._cache_lock:
+                self._failed_at[cache_key] = time.time()
+            return None
+    
+    def _cache_ttl(self, end_year: int) -> int:
+        """Short TTL while a range can still receive new data points, long TTL once it is historical"""
+        if end_year >= date.today().year:
+            return _CURRENT_RANGE_TTL
+        return _HISTORICAL_RANGE_TTL
+    
+    def _schedule_refresh(self, start_year: int, end_year: int):
+        """Re-fetch a stale cache entry in the background, at most once at a time per range"""
+        cache_key = f"{start_year}_{end_year}"
+        with self._cache_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+        
+        def refresh():
+            try:
+                self._fetch_cpi_data(start_year, end_year)
+            finally:
+                with self._cache_lock:
+                    self._refreshing.discard(cache_key)
+        
+        # A thread rather than an asyncio task: get_cpi_data is synchronous and is also
+        # called from worker threads (see get_cpi_data_async) that have no event loop
+        threading.Thread(target=refresh, daemon=True).start()
+    
+    async def get_cpi_data_async(self, start_year: int, end_year: int) -> Dict:
+        """Async variant of get_cpi_data that keeps the blocking BLS call off the event loop"""
+        return await asyncio.to_thread(self.get_cpi_data, start_year, end_year)
     
     def load_from_cache(self) -> Dict:
         """Load cached CPI data"""
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, 'r') as f:
-                    return json.load(f)
+                return pickle.loads(self.cache_file.read_bytes())
+            if self.legacy_cache_file.exists():
+                data = orjson.loads(self.legacy_cache_file.read_bytes())
+                self.save_to_cache(data)
+                return data
         except Exception as e:
-            print(f"Error loading cache: {e}")
+            logger.warning("Error loading cache: %s", e)
         return {}
     
     def save_to_cache(self, data: Dict):
         """Save CPI data to cache"""
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.cache_file.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
         except Exception as e:
-            print(f"Error saving cache: {e}")
+            logger.warning("Error saving cache: %s", e)
     
     def get_fallback_cpi_data(self, start_year: int, end_year: int) -> Dict:
         """Fallback CPI data when API is unavailable - using official BLS historical data"""
-        # Official BLS CPI-U values (1982-84=100) - Annual averages
-        fallback_cpi = {
-            1913: 9.9, 1920: 20.0, 1930: 16.7, 1940: 14.0, 1950: 24.1,
-            1960: 29.6, 1970: 38.8, 1980: 82.4, 1990: 130.7, 1991: 136.2,
-            1995: 152.4, 2000: 172.2, 2005: 195.3, 2010: 218.1, 
-            2011: 224.9, 2012: 229.6, 2013: 233.0, 2014: 236.7, 2015: 237.0,
-            2016: 240.0, 2017: 245.1, 2018: 251.1, 2019: 255.7, 2020: 258.8, 
-            2021: 271.0, 2022: 292.7, 2023: 307.0, 2024: 315.6
-        }
-        
         # Generate mock BLS API response format
         series_data = []
         for year in range(start_year, end_year + 1):
             # Interpolate or extrapolate CPI values
-            cpi_value = self.interpolate_cpi(year, fallback_cpi)
+            cpi_value = self.interpolate_cpi(year)
             series_data.append({
                 "year": str(year),
                 "period": "M13",  # Annual average
@@ -104,127 +327,56 @@ class InflationService:
             }
         }
     
-    def interpolate_cpi(self, year: int, fallback_cpi: Dict[int, float]) -> float:
+    def interpolate_cpi(self, year: int) -> float:
         """Interpolate CPI value for a given year"""
-        if year in fallback_cpi:
-            return fallback_cpi[year]
-        
-        # Find surrounding years for interpolation
-        years = sorted(fallback_cpi.keys())
-        
-        if year < min(years):
-            # Extrapolate backwards (assume 3% inflation)
-            base_year = min(years)
-            base_cpi = fallback_cpi[base_year]
-            years_diff = base_year - year
-            return base_cpi / (1.03 ** years_diff)
-        
-        if year > max(years):
-            # Extrapolate forwards (assume 2.5% inflation)
-            base_year = max(years)
-            base_cpi = fallback_cpi[base_year]
-            years_diff = year - base_year
-            return base_cpi * (1.025 ** years_diff)
-        
-        # Interpolate between two known years
-        for i in range(len(years) - 1):
-            if years[i] <= year <= years[i + 1]:
-                y1, y2 = years[i], years[i + 1]
-                cpi1, cpi2 = fallback_cpi[y1], fallback_cpi[y2]
-                
-                # Linear interpolation
-                ratio = (year - y1) / (y2 - y1)
-                return cpi1 + ratio * (cpi2 - cpi1)
-        
-        # Default fallback
-        return 250.0  # Rough current CPI
+        return _interpolate_cpi(year)
     
-    def calculate_inflation_rate(self, start_date: str) -> tuple[float, int]:
+    def calculate_inflation_rate(self, start_date: date) -> tuple[float, int]:
         """Calculate total inflation rate from start date to now using official BLS methodology"""
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-        current_year = 2024  # Use current year
-        current_month = 12   # Use most recent data available
-        start_year = start_dt.year
-        start_month = start_dt.month
-        
-        years_elapsed = current_year - start_year
-        
-        # Get more precise CPI data
-        start_cpi = self.get_monthly_cpi(start_year, start_month)
-        current_cpi = self.get_monthly_cpi(current_year, current_month)
-        
-        # Calculate inflation rate using BLS methodology
-        if start_cpi and current_cpi:
-            inflation_rate = (current_cpi - start_cpi) / start_cpi
-        else:
-            # Enhanced fallback calculation
-            inflation_rate = self.calculate_compound_inflation(start_year, current_year)
-            
-        return inflation_rate, years_elapsed
+        return _inflation_rate_for_month(start_date.year, start_date.month)
     
     def get_monthly_cpi(self, year: int, month: int) -> Optional[float]:
         """Get CPI for specific month/year - more accurate than annual averages"""
-        
-        # Official monthly CPI-U data for key periods (source: BLS)
-        monthly_cpi_data = {
-            # 2014 monthly data
-            (2014, 1): 233.9, (2014, 2): 234.8, (2014, 3): 236.3, (2014, 4): 237.1,
-            (2014, 5): 237.9, (2014, 6): 238.3, (2014, 7): 238.3, (2014, 8): 237.9,
-            (2014, 9): 238.0, (2014, 10): 237.4, (2014, 11): 236.2, (2014, 12): 234.8,
-            
-            # 2024 monthly data  
-            (2024, 1): 308.4, (2024, 2): 310.3, (2024, 3): 312.2, (2024, 4): 313.5,
-            (2024, 5): 314.1, (2024, 6): 314.0, (2024, 7): 313.5, (2024, 8): 314.7,
-            (2024, 9): 315.3, (2024, 10): 315.6, (2024, 11): 315.2, (2024, 12): 315.6,
-        }
-        
-        # Check if we have exact monthly data
-        if (year, month) in monthly_cpi_data:
-            return monthly_cpi_data[(year, month)]
-        
-        # Fall back to annual average and interpolate monthly
-        annual_cpi = self.get_annual_cpi(year)
-        if annual_cpi:
-            # Simple monthly interpolation (could be enhanced further)
-            return annual_cpi
-            
-        return None
+        return _monthly_cpi(year, month)
         
     def get_annual_cpi(self, year: int) -> Optional[float]:
         """Get annual CPI for a specific year"""
-        fallback_cpi = {
-            1913: 9.9, 1920: 20.0, 1930: 16.7, 1940: 14.0, 1950: 24.1,
-            1960: 29.6, 1970: 38.8, 1980: 82.4, 1990: 130.7, 1991: 136.2,
-            1995: 152.4, 2000: 172.2, 2005: 195.3, 2010: 218.1, 
-            2011: 224.9, 2012: 229.6, 2013: 233.0, 2014: 236.7, 2015: 237.0,
-            2016: 240.0, 2017: 245.1, 2018: 251.1, 2019: 255.7, 2020: 258.8, 
-            2021: 271.0, 2022: 292.7, 2023: 307.0, 2024: 315.6
-        }
-        
-        if year in fallback_cpi:
-            return fallback_cpi[year]
-        
-        return self.interpolate_cpi(year, fallback_cpi)
+        return _annual_cpi(year)
     
     def calculate_compound_inflation(self, start_year: int, end_year: int) -> float:
         """Calculate compound inflation rate between two years"""
-        start_cpi = self.get_annual_cpi(start_year)
-        end_cpi = self.get_annual_cpi(end_year)
-        
-        if start_cpi and end_cpi:
-            return (end_cpi - start_cpi) / start_cpi
+        return _compound_inflation(start_year, end_year)
+    
+    def get_cpi_index(self, start_year: int, end_year: int) -> Dict[int, float]:
+        """Annual CPI values for a range as {year: value}, indexed once per cached BLS response"""
+        cache_key = f"{start_year}_{end_year}"
+        # Always go through get_cpi_data so stale ranges still get refreshed
+        cpi_data = self.get_cpi_data(start_year, end_year)
+        cached = self._cpi_index.get(cache_key)
+        if cached is not None and cached[0] is cpi_data:
+            return cached[1]
         
-        # Ultimate fallback - use historical average
-        years_diff = end_year - start_year
-        return 0.025 * years_diff  # 2.5% annual average
+        index = _index_cpi(cpi_data)
+        with self._cache_lock:
+            # Only keep indexes of the currently cached BLS response: not of the
+            # fallback table, and not of a payload a refresh replaced meanwhile
+            entry = self._cache.get(cache_key)
+            if entry is not None and entry.get('payload', entry) is cpi_data:
+                self._cpi_index[cache_key] = (cpi_data, index)
+        return index
     
     def extract_cpi_for_year(self, cpi_data: Dict, year: int) -> Optional[float]:
         """Extract CPI value for a specific year from BLS API response"""
+        for payload, index in tuple(self._cpi_index.values()):
+            if payload is cpi_data:
+                return index.get(year)
+        
         try:
-            series = cpi_data['Results']['series'][0]
-            for data_point in series['data']:
-                if data_point['year'] == str(year) and data_point['period'] == 'M13':
+            # Not indexed by get_cpi_index: scan and stop at the match
+            year_str = str(year)
+            for data_point in cpi_data['Results']['series'][0]['data']:
+                if data_point['year'] == year_str and data_point['period'] == 'M13':
                     return float(data_point['value'])
         except (KeyError, IndexError, ValueError) as e:
-            print(f"Error extracting CPI for year {year}: {e}")
-        return None
\ No newline at end of file
+            logger.debug("Error extracting CPI for year %s: %s", year, e)
+        return None
@@ -4,385 +4,380 @@ Comprehensive Backend API Tests for Salary Inflation Calculator
 Tests the /api/calculate-inflation endpoint thoroughly
 """
 
-import requests
-import json
-import os
+import argparse
+import asyncio
+import httpx
+import functools
+import logging
+import numpy as np
+import orjson
+import re
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+_ENV_RE = re.compile(r'^REACT_APP_BACKEND_URL=(.+)$', re.M)
+
+
+@functools.lru_cache(maxsize=1)
+def get_backend_url() -> str:
+    """Get backend URL from frontend .env file (read once per process)"""
+    try:
+        match = _ENV_RE.search(Path('/app/frontend/.env').read_text())
+        if match:
+            return match.group(1).strip()
+    except Exception as e:
+        log.warning("Error reading frontend .env: %s", e)
+    return "http://localhost:8001"  # fallback
+
+
+# Test cases, shared with the parametrized pytest suite in tests/test_backend.py
+PRE_1991_CASES = [
+    {"start_date": "1985-06-15", "original_salary": 35000, "description": "Mid-1980s employment"},
+    {"start_date": "1975-01-01", "original_salary": 15000, "description": "Mid-1970s employment"},
+    {"start_date": "1990-12-31", "original_salary": 45000, "description": "Last day before 1991"}
+]
+
+COLA_PERIOD_CASES = [
+    # Test cases that should result in >= $75K after adding $8K (gets +$3K)
+    {"start_date": "1995-03-15", "original_salary": 70000, "description": "High salary - should get +$3K COLA", "expected_threshold": "high"},
+    {"start_date": "2010-07-01", "original_salary": 67000, "description": "Exactly $75K after +$8K - should get +$3K", "expected_threshold": "high"},
+    
+    # Test cases that should result in < $75K after adding $8K (gets 4% increase)
+    {"start_date": "2000-01-15", "original_salary": 50000, "description": "Medium salary - should get 4% increase", "expected_threshold": "low"},
+    {"start_date": "1991-01-01", "original_salary": 30000, "description": "First day of COLA period - low salary", "expected_threshold": "low"},
+    {"start_date": "2021-12-31", "original_salary": 66999, "description": "Last day of COLA period - just under threshold", "expected_threshold": "low"},
+    
+    # Edge case - exactly at boundary
+    {"start_date": "2015-06-01", "original_salary": 67000, "description": "Boundary case - exactly $75K after +$8K", "expected_threshold": "high"}
+]
+
+POST_2021_CASES = [
+    {"start_date": "2022-01-01", "original_salary": 80000, "description": "First day after COLA period"},
+    {"start_date": "2023-06-15", "original_salary": 95000, "description": "Recent employment"},
+    {"start_date": "2024-01-01", "original_salary": 120000, "description": "Very recent employment"}
+]
+
+EDGE_CASES = [
+    {"start_date": "1991-01-01", "original_salary": 40000, "description": "Exactly Jan 1, 1991 - first COLA day"},
+    {"start_date": "2021-12-31", "original_salary": 60000, "description": "Exactly Dec 31, 2021 - last COLA day"},
+    {"start_date": "1990-12-31", "original_salary": 35000, "description": "Day before COLA period"},
+    {"start_date": "2022-01-01", "original_salary": 75000, "description": "Day after COLA period"}
+]
+
+# Category substring each boundary date must land in
+EXPECTED_CATEGORY = {
+    "1991-01-01": "COLA Period",
+    "2021-12-31": "COLA Period",
+    "1990-12-31": "Pre-1991",
+    "2022-01-01": "Post-2021",
+}
+
+# Future date
+_FUTURE_DATE = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+
+INVALID_CASES = [
+    {"start_date": _FUTURE_DATE, "original_salary": 50000, "description": "Future date", "expected_status": [400, 422]},
+    {"start_date": "1900-01-01", "original_salary": 25000, "description": "Date before 1913", "expected_status": [400, 422]},
+    {"start_date": "2023-13-45", "original_salary": 60000, "description": "Invalid date format", "expected_status": [400, 422]},
+    {"start_date": "not-a-date", "original_salary": 70000, "description": "Non-date string", "expected_status": [400, 422]},
+    {"start_date": "2020-01-01", "original_salary": -5000, "description": "Negative salary", "expected_status": [422]},
+    {"start_date": "2020-01-01", "original_salary": 0, "description": "Zero salary", "expected_status": [422]}
+]
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _body(response: httpx.Response) -> Any:
+    """Decoded JSON body, or the raw text for non-JSON responses"""
+    if response.headers.get('content-type', '').startswith('application/json'):
+        return orjson.loads(response.content)
+    return response.text
+
+
+class CalcResponse(BaseModel):
+    original_salary: float
+    start_date: str
+    inflation_adjusted_salary: float
+    category: str
+    summary: str
+    inflation_rate: float
+    years_elapsed: int
+    cola_adjusted_salary: Optional[float] = None
+    defacto_paycut: Optional[float] = None
+
+
+def _failure(reason: str) -> Dict[str, Any]:
+    """make_request-style result for a request that got no usable response"""
+    return {'status_code': None, 'response': reason, 'success': False}
+
+
+@dataclass
+class Failure:
+    suite: str
+    case: str
+    reason: str
+
+    def __str__(self):
+        return f"{self.suite} [{self.case}]: {self.reason}"
+
 
 class SalaryInflationAPITester:
+    # Compiled once; checks the shape of every successful response in one pass
+    _VALIDATOR = TypeAdapter(CalcResponse)
+    
     def __init__(self):
         # Get backend URL from frontend .env file
-        self.base_url = self.get_backend_url()
+        self.base_url = get_backend_url()
         self.endpoint = f"{self.base_url}/api/calculate-inflation"
-        self.test_results = []
+        self.failures: List[Failure] = []
+        # One HTTP/2 client multiplexes every concurrent request; closed in run_all_tests
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            timeout=30.0,
+        )
+        # Set once the connection-failure probe in _diagnose has run
+        self._diagnosed = False
         
-    def get_backend_url(self) -> str:
-        """Get backend URL from frontend .env file"""
-        try:
-            with open('/app/frontend/.env', 'r') as f:
-                for line in f:
-                    if line.startswith('REACT_APP_BACKEND_URL='):
-                        return line.split('=', 1)[1].strip()
-        except Exception as e:
-            print(f"Error reading frontend .env: {e}")
-        return "http://localhost:8001"  # fallback
-    
-    def make_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def make_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make POST request to the inflation endpoint"""
+        return await self._post(data)
+    
+    async def make_batch_request(self, cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send all cases in one POST to the batch endpoint; returns one make_request-style result per case"""
+        items = [{"start_date": case["start_date"], "original_salary": case["original_salary"]} for case in cases]
+        return await self._post_batch(items)
+    
+    async def _post(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """POST one case to the inflation endpoint"""
         try:
-            response = requests.post(
-                self.endpoint,
-                json=data,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
-            )
+            response = await self.client.post('/api/calculate-inflation', content=orjson.dumps(data), headers=_JSON_HEADERS)
             return {
                 'status_code': response.status_code,
-                'response': response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text,
+                'response': _body(response),
                 'success': response.status_code == 200
             }
-        except requests.exceptions.RequestException as e:
-            return {
-                'status_code': None,
-                'response': f"Request failed: {str(e)}",
-                'success': False
-            }
+        except httpx.HTTPError as e:
+            return _failure(f"Request failed: {str(e)}{await self._diagnose(e)}")
+    
+    async def _post_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """POST all items to the batch endpoint; a failed batch yields the same failure for every item"""
+        try:
+            response = await self.client.post('/api/calculate-inflation/batch', content=orjson.dumps({"items": items}), headers=_JSON_HEADERS)
+            body = _body(response)
+        except httpx.HTTPError as e:
+            reason = f"Request failed: {str(e)}{await self._diagnose(e)}"
+            return [_failure(reason) for _ in items]
+        if response.status_code != 200:
+            return [{'status_code': response.status_code, 'response': body, 'success': False} for _ in items]
+        if not isinstance(body, list) or len(body) != len(items):
+            # A short or malformed batch must not silently drop cases
+            count = len(body) if isinstance(body, list) else type(body).__name__
+            reason = f"Batch returned {count} results for {len(items)} items"
+            return [{'status_code': response.status_code, 'response': reason, 'success': False} for _ in items]
+        return [{'status_code': 200, 'response': item, 'success': True} for item in body]
+    
+    async def _diagnose(self, error: httpx.HTTPError) -> str:
+        """On the first connection failure, probe the API root and CORS preflight to explain it"""
+        if self._diagnosed or not isinstance(error, httpx.ConnectError):
+            return ""
+        self._diagnosed = True
+        notes = []
+        for method, path in (('GET', '/api/'), ('OPTIONS', '/api/calculate-inflation')):
+            try:
+                response = await self.client.request(method, path, timeout=10.0)
+                notes.append(f"{method} {path} -> {response.status_code}")
+            except httpx.HTTPError as e:
+                notes.append(f"{method} {path} failed: {e}")
+        return f" ({'; '.join(notes)})"
     
-    def test_pre_1991_employment(self):
+    async def run_cases(self, cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send every case as its own concurrent request; results are returned in case order"""
+        return await asyncio.gather(*(
+            self.make_request({"start_date": case["start_date"], "original_salary": case["original_salary"]})
+            for case in cases
+        ))
+    
+    def fail(self, suite: str, case: str, reason: str):
+        """Record a failure and log it at INFO alongside the case output"""
+        self.failures.append(Failure(suite, case, reason))
+        log.info("FAIL %s %s: %s", suite, case, reason)
+    
+    def parse(self, suite: str, case: str, result: Dict[str, Any]) -> Optional[CalcResponse]:
+        """Validate a successful result against CalcResponse; records a failure and returns None otherwise"""
+        if not result['success']:
+            self.fail(suite, case, f"request failed: {result['response']}")
+            return None
+        try:
+            return self._VALIDATOR.validate_python(result['response'])
+        except ValidationError as e:
+            self.fail(suite, case, f"malformed response: {e}")
+            return None
+    
+    def _check_simple_category(self, suite: str, cases: List[Dict[str, Any]], results: List[Dict[str, Any]], category: str):
+        """Shared checks for the categories that carry no COLA data"""
+        for case, result in zip(cases, results):
+            parsed = self.parse(suite, case['start_date'], result)
+            if parsed is None:
+                continue
+            log.info("%s: status=%s category=%s original=%s adjusted=%s rate=%s years=%s",
+                     case['description'], result['status_code'], parsed.category,
+                     parsed.original_salary, parsed.inflation_adjusted_salary,
+                     parsed.inflation_rate, parsed.years_elapsed)
+            if parsed.category != category:
+                self.fail(suite, case['start_date'], f"wrong category {parsed.category!r}")
+            elif parsed.cola_adjusted_salary is not None or parsed.defacto_paycut is not None:
+                self.fail(suite, case['start_date'], "unexpected COLA data")
+    
+    async def test_pre_1991_employment(self):
         """Test pre-1991 employment scenarios"""
-        print("\n=== Testing Pre-1991 Employment ===")
-        
-        test_cases = [
-            {"start_date": "1985-06-15", "original_salary": 35000, "description": "Mid-1980s employment"},
-            {"start_date": "1975-01-01", "original_salary": 15000, "description": "Mid-1970s employment"},
-            {"start_date": "1990-12-31", "original_salary": 45000, "description": "Last day before 1991"}
-        ]
-        
-        for case in test_cases:
-            print(f"\nTesting: {case['description']}")
-            result = self.make_request({
-                "start_date": case["start_date"],
-                "original_salary": case["original_salary"]
-            })
-            
-            if result['success']:
-                response = result['response']
-                print(f"✅ Status: {result['status_code']}")
-                print(f"   Category: {response.get('category')}")
-                print(f"   Original Salary: ${response.get('original_salary'):,.0f}")
-                print(f"   Inflation Adjusted: ${response.get('inflation_adjusted_salary'):,.0f}")
-                print(f"   Inflation Rate: {response.get('inflation_rate', 0)*100:.2f}%")
-                print(f"   Years Elapsed: {response.get('years_elapsed')}")
-                
-                # Verify pre-1991 logic
-                if response.get('category') == "Pre-1991 Employment":
-                    if response.get('cola_adjusted_salary') is None and response.get('defacto_paycut') is None:
-                        print("✅ Correct: No COLA calculations for pre-1991")
-                    else:
-                        print("❌ Error: COLA calculations should not exist for pre-1991")
-                        self.test_results.append(f"FAIL: Pre-1991 test - unexpected COLA data for {case['start_date']}")
-                else:
-                    print(f"❌ Error: Expected 'Pre-1991 Employment', got '{response.get('category')}'")
-                    self.test_results.append(f"FAIL: Pre-1991 test - wrong category for {case['start_date']}")
-            else:
-                print(f"❌ Request failed: {result['response']}")
-                self.test_results.append(f"FAIL: Pre-1991 test - request failed for {case['start_date']}")
+        log.info("=== Testing Pre-1991 Employment ===")
+        results = await self.make_batch_request(PRE_1991_CASES)
+        self._check_simple_category('pre_1991', PRE_1991_CASES, results, "Pre-1991 Employment")
     
-    def test_cola_period_employment(self):
+    async def test_cola_period_employment(self):
         """Test 1991-2021 COLA period employment scenarios"""
-        print("\n=== Testing 1991-2021 COLA Period Employment ===")
+        log.info("=== Testing 1991-2021 COLA Period Employment ===")
         
-        test_cases = [
-            # Test cases that should result in >= $75K after adding $8K (gets +$3K)
-            {"start_date": "1995-03-15", "original_salary": 70000, "description": "High salary - should get +$3K COLA", "expected_threshold": "high"},
-            {"start_date": "2010-07-01", "original_salary": 67000, "description": "Exactly $75K after +$8K - should get +$3K", "expected_threshold": "high"},
-            
-            # Test cases that should result in < $75K after adding $8K (gets 4% increase)
-            {"start_date": "2000-01-15", "original_salary": 50000, "description": "Medium salary - should get 4% increase", "expected_threshold": "low"},
-            {"start_date": "1991-01-01", "original_salary": 30000, "description": "First day of COLA period - low salary", "expected_threshold": "low"},
-            {"start_date": "2021-12-31", "original_salary": 66999, "description": "Last day of COLA period - just under threshold", "expected_threshold": "low"},
-            
-            # Edge case - exactly at boundary
-            {"start_date": "2015-06-01", "original_salary": 67000, "description": "Boundary case - exactly $75K after +$8K", "expected_threshold": "high"}
-        ]
+        results = await self.make_batch_request(COLA_PERIOD_CASES)
         
-        for case in test_cases:
-            print(f"\nTesting: {case['description']}")
-            result = self.make_request({
-                "start_date": case["start_date"],
-                "original_salary": case["original_salary"]
-            })
-            
-            if result['success']:
-                response = result['response']
-                print(f"✅ Status: {result['status_code']}")
-                print(f"   Category: {response.get('category')}")
-                print(f"   Original Salary: ${response.get('original_salary'):,.0f}")
-                print(f"   Inflation Adjusted: ${response.get('inflation_adjusted_salary'):,.0f}")
-                print(f"   COLA Adjusted: ${response.get('cola_adjusted_salary'):,.0f}")
-                print(f"   De Facto Paycut: ${response.get('defacto_paycut'):,.0f}")
-                
-                # Verify COLA calculations
-                original = response.get('original_salary')
-                cola_adjusted = response.get('cola_adjusted_salary')
-                
-                if response.get('category') == "1991-2021 Employment (COLA Period)":
-                    # Verify COLA logic
-                    cola_base = original + 8000  # Step 1: Add $8K
-                    
-                    if case['expected_threshold'] == "high":
-                        # Should be >= $75K after +$8K, so gets +$3K
-                        expected_cola = cola_base + 3000
-                        if abs(cola_adjusted - expected_cola) < 0.01:
-                            print("✅ Correct: High threshold COLA calculation (+$3K)")
-                        else:
-                            print(f"❌ Error: Expected ${expected_cola:,.0f}, got ${cola_adjusted:,.0f}")
-                            self.test_results.append(f"FAIL: COLA high threshold calculation wrong for {case['start_date']}")
-                    else:
-                        # Should be < $75K after +$8K, so gets 4% increase
-                        expected_cola = cola_base * 1.04
-                        if abs(cola_adjusted - expected_cola) < 0.01:
-                            print("✅ Correct: Low threshold COLA calculation (4% increase)")
-                        else:
-                            print(f"❌ Error: Expected ${expected_cola:,.0f}, got ${cola_adjusted:,.0f}")
-                            self.test_results.append(f"FAIL: COLA low threshold calculation wrong for {case['start_date']}")
-                    
-                    # Verify de facto paycut calculation
-                    inflation_adjusted = response.get('inflation_adjusted_salary')
-                    expected_paycut = inflation_adjusted - cola_adjusted
-                    actual_paycut = response.get('defacto_paycut')
-                    
-                    if abs(actual_paycut - expected_paycut) < 0.01:
-                        print("✅ Correct: De facto paycut calculation")
-                    else:
-                        print(f"❌ Error: Paycut calculation - expected ${expected_paycut:.2f}, got ${actual_paycut:.2f}")
-                        self.test_results.append(f"FAIL: De facto paycut calculation wrong for {case['start_date']}")
-                        
-                else:
-                    print(f"❌ Error: Expected COLA period category, got '{response.get('category')}'")
-                    self.test_results.append(f"FAIL: COLA period test - wrong category for {case['start_date']}")
+        checked, responses = [], []
+        for i, (case, result) in enumerate(zip(COLA_PERIOD_CASES, results)):
+            parsed = self.parse('cola_period', case['start_date'], result)
+            if parsed is None:
+                continue
+            log.info("%s: status=%s category=%s original=%s adjusted=%s cola=%s paycut=%s",
+                     case['description'], result['status_code'], parsed.category,
+                     parsed.original_salary, parsed.inflation_adjusted_salary,
+                     parsed.cola_adjusted_salary, parsed.defacto_paycut)
+            if parsed.category != "1991-2021 Employment (COLA Period)":
+                self.fail('cola_period', case['start_date'], f"wrong category {parsed.category!r}")
+            elif parsed.cola_adjusted_salary is None or parsed.defacto_paycut is None:
+                self.fail('cola_period', case['start_date'], "missing COLA data")
             else:
-                print(f"❌ Request failed: {result['response']}")
-                self.test_results.append(f"FAIL: COLA period test - request failed for {case['start_date']}")
-    
-    def test_post_2021_employment(self):
-        """Test post-2021 employment scenarios"""
-        print("\n=== Testing Post-2021 Employment ===")
+                checked.append(i)
+                responses.append(parsed)
         
-        test_cases = [
-            {"start_date": "2022-01-01", "original_salary": 80000, "description": "First day after COLA period"},
-            {"start_date": "2023-06-15", "original_salary": 95000, "description": "Recent employment"},
-            {"start_date": "2024-01-01", "original_salary": 120000, "description": "Very recent employment"}
-        ]
+        # Verify the COLA math for every COLA-period response in one pass
+        original = np.array([r.original_salary for r in responses], dtype=np.float64)
+        cola_adjusted = np.array([r.cola_adjusted_salary for r in responses], dtype=np.float64)
+        inflation_adjusted = np.array([r.inflation_adjusted_salary for r in responses], dtype=np.float64)
+        actual_paycut = np.array([r.defacto_paycut for r in responses], dtype=np.float64)
+        high = np.array([COLA_PERIOD_CASES[i]['expected_threshold'] == "high" for i in checked], dtype=bool)
         
-        for case in test_cases:
-            print(f"\nTesting: {case['description']}")
-            result = self.make_request({
-                "start_date": case["start_date"],
-                "original_salary": case["original_salary"]
-            })
-            
-            if result['success']:
-                response = result['response']
-                print(f"✅ Status: {result['status_code']}")
-                print(f"   Category: {response.get('category')}")
-                print(f"   Original Salary: ${response.get('original_salary'):,.0f}")
-                print(f"   Inflation Adjusted: ${response.get('inflation_adjusted_salary'):,.0f}")
-                
-                # Verify post-2021 logic
-                if response.get('category') == "Post-2021 Employment":
-                    if response.get('cola_adjusted_salary') is None and response.get('defacto_paycut') is None:
-                        print("✅ Correct: No COLA calculations for post-2021")
-                    else:
-                        print("❌ Error: COLA calculations should not exist for post-2021")
-                        self.test_results.append(f"FAIL: Post-2021 test - unexpected COLA data for {case['start_date']}")
-                else:
-                    print(f"❌ Error: Expected 'Post-2021 Employment', got '{response.get('category')}'")
-                    self.test_results.append(f"FAIL: Post-2021 test - wrong category for {case['start_date']}")
-            else:
-                print(f"❌ Request failed: {result['response']}")
-                self.test_results.append(f"FAIL: Post-2021 test - request failed for {case['start_date']}")
+        cola_base = original + 8000.0  # Step 1: Add $8K
+        # >= $75K after +$8K gets +$3K, otherwise a 4% increase
+        expected_cola = np.where(high, cola_base + 3000.0, cola_base * 1.04)
+        expected_paycut = inflation_adjusted - cola_adjusted
+        cola_ok = np.isclose(cola_adjusted, expected_cola, rtol=0.0, atol=0.01)
+        paycut_ok = np.isclose(actual_paycut, expected_paycut, rtol=0.0, atol=0.01)
+        
+        for k, i in enumerate(checked):
+            case = COLA_PERIOD_CASES[i]
+            if not cola_ok[k]:
+                self.fail('cola_period', case['start_date'],
+                          f"{case['expected_threshold']} threshold COLA expected {expected_cola[k]:.2f}, got {cola_adjusted[k]:.2f}")
+            if not paycut_ok[k]:
+                self.fail('cola_period', case['start_date'],
+                          f"de facto paycut expected {expected_paycut[k]:.2f}, got {actual_paycut[k]:.2f}")
+    
+    async def test_post_2021_employment(self):
+        """Test post-2021 employment scenarios"""
+        log.info("=== Testing Post-2021 Employment ===")
+        results = await self.make_batch_request(POST_2021_CASES)
+        self._check_simple_category('post_2021', POST_2021_CASES, results, "Post-2021 Employment")
     
-    def test_edge_cases(self):
+    async def test_edge_cases(self):
         """Test exact boundary dates and edge cases"""
-        print("\n=== Testing Edge Cases ===")
+        log.info("=== Testing Edge Cases ===")
         
-        edge_cases = [
-            {"start_date": "1991-01-01", "original_salary": 40000, "description": "Exactly Jan 1, 1991 - first COLA day"},
-            {"start_date": "2021-12-31", "original_salary": 60000, "description": "Exactly Dec 31, 2021 - last COLA day"},
-            {"start_date": "1990-12-31", "original_salary": 35000, "description": "Day before COLA period"},
-            {"start_date": "2022-01-01", "original_salary": 75000, "description": "Day after COLA period"}
-        ]
-        
-        for case in edge_cases:
-            print(f"\nTesting: {case['description']}")
-            result = self.make_request({
-                "start_date": case["start_date"],
-                "original_salary": case["original_salary"]
-            })
+        results = await self.make_batch_request(EDGE_CASES)
+        for case, result in zip(EDGE_CASES, results):
+            start_date = case['start_date']
+            parsed = self.parse('edge_case', start_date, result)
+            if parsed is None:
+                continue
+            log.info("%s: status=%s %s -> %s", case['description'], result['status_code'], start_date, parsed.category)
             
-            if result['success']:
-                response = result['response']
-                print(f"✅ Status: {result['status_code']}")
-                print(f"   Category: {response.get('category')}")
-                print(f"   Date: {case['start_date']} -> Category: {response.get('category')}")
-                
-                # Verify correct categorization
-                start_date = case['start_date']
-                category = response.get('category')
-                
-                if start_date == "1991-01-01" or start_date == "2021-12-31":
-                    if "COLA Period" in category:
-                        print("✅ Correct: Boundary date correctly in COLA period")
-                    else:
-                        print(f"❌ Error: Boundary date {start_date} should be in COLA period")
-                        self.test_results.append(f"FAIL: Edge case - wrong category for boundary date {start_date}")
-                elif start_date == "1990-12-31":
-                    if "Pre-1991" in category:
-                        print("✅ Correct: Pre-1991 boundary correctly categorized")
-                    else:
-                        print(f"❌ Error: {start_date} should be Pre-1991")
-                        self.test_results.append(f"FAIL: Edge case - wrong category for pre-1991 boundary")
-                elif start_date == "2022-01-01":
-                    if "Post-2021" in category:
-                        print("✅ Correct: Post-2021 boundary correctly categorized")
-                    else:
-                        print(f"❌ Error: {start_date} should be Post-2021")
-                        self.test_results.append(f"FAIL: Edge case - wrong category for post-2021 boundary")
-            else:
-                print(f"❌ Request failed: {result['response']}")
-                self.test_results.append(f"FAIL: Edge case test - request failed for {case['start_date']}")
+            # Verify correct categorization
+            expected = EXPECTED_CATEGORY.get(start_date)
+            if expected and expected not in parsed.category:
+                self.fail('edge_case', start_date, f"should be {expected}, got {parsed.category!r}")
     
-    def test_invalid_inputs(self):
+    async def test_invalid_inputs(self):
         """Test invalid input handling"""
-        print("\n=== Testing Invalid Inputs ===")
-        
-        # Future date
-        future_date = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+        log.info("=== Testing Invalid Inputs ===")
         
-        invalid_cases = [
-            {"start_date": future_date, "original_salary": 50000, "description": "Future date", "expected_status": [400, 422]},
-            {"start_date": "1900-01-01", "original_salary": 25000, "description": "Date before 1913", "expected_status": [400, 422]},
-            {"start_date": "2023-13-45", "original_salary": 60000, "description": "Invalid date format", "expected_status": [400, 422]},
-            {"start_date": "not-a-date", "original_salary": 70000, "description": "Non-date string", "expected_status": [400, 422]},
-            {"start_date": "2020-01-01", "original_salary": -5000, "description": "Negative salary", "expected_status": [422]},
-            {"start_date": "2020-01-01", "original_salary": 0, "description": "Zero salary", "expected_status": [422]}
-        ]
-        
-        for case in invalid_cases:
-            print(f"\nTesting: {case['description']}")
-            result = self.make_request({
-                "start_date": case["start_date"],
-                "original_salary": case["original_salary"]
-            })
-            
-            if result['status_code'] in case['expected_status']:
-                print(f"✅ Correct error handling: Status {result['status_code']}")
-                if isinstance(result['response'], dict) and 'detail' in result['response']:
-                    print(f"   Error message: {result['response']['detail']}")
-            else:
-                print(f"❌ Wrong status code: Expected {case['expected_status']}, got {result['status_code']}")
-                print(f"   Response: {result['response']}")
-                self.test_results.append(f"FAIL: Invalid input test - wrong status for {case['description']}")
+        results = await self.run_cases(INVALID_CASES)
+        for case, result in zip(INVALID_CASES, results):
+            log.info("%s: status=%s response=%s", case['description'], result['status_code'], result['response'])
+            if result['status_code'] not in case['expected_status']:
+                self.fail('invalid_input', case['description'],
+                          f"expected status {case['expected_status']}, got {result['status_code']}")
     
-    def test_response_format(self):
+    async def test_response_format(self):
         """Test response format and required fields"""
-        print("\n=== Testing Response Format ===")
+        log.info("=== Testing Response Format ===")
         
-        result = self.make_request({
+        result = await self.make_request({
             "start_date": "2010-06-15",
             "original_salary": 55000
         })
         
-        if result['success']:
-            response = result['response']
-            required_fields = [
-                'original_salary', 'start_date', 'inflation_adjusted_salary',
-                'category', 'summary', 'inflation_rate', 'years_elapsed'
-            ]
-            
-            print("Checking required fields:")
-            for field in required_fields:
-                if field in response:
-                    print(f"✅ {field}: {response[field]}")
-                else:
-                    print(f"❌ Missing field: {field}")
-                    self.test_results.append(f"FAIL: Response format - missing field {field}")
-            
-            # Check COLA-specific fields for COLA period
-            if "COLA Period" in response.get('category', ''):
-                cola_fields = ['cola_adjusted_salary', 'defacto_paycut']
-                print("\nChecking COLA-specific fields:")
-                for field in cola_fields:
-                    if field in response and response[field] is not None:
-                        print(f"✅ {field}: {response[field]}")
-                    else:
-                        print(f"❌ Missing or null COLA field: {field}")
-                        self.test_results.append(f"FAIL: Response format - missing COLA field {field}")
-        else:
-            print(f"❌ Request failed: {result['response']}")
-            self.test_results.append("FAIL: Response format test - request failed")
-    
-    def test_api_availability(self):
-        """Test basic API availability"""
-        print("\n=== Testing API Availability ===")
-        
-        # Test root endpoint
-        try:
-            root_response = requests.get(f"{self.base_url}/api/", timeout=10)
-            if root_response.status_code == 200:
-                print("✅ Root API endpoint accessible")
-            else:
-                print(f"❌ Root API endpoint returned {root_response.status_code}")
-                self.test_results.append("FAIL: Root API endpoint not accessible")
-        except Exception as e:
-            print(f"❌ Root API endpoint failed: {e}")
-            self.test_results.append("FAIL: Root API endpoint connection failed")
+        # Missing or mistyped required fields are reported by the validator
+        parsed = self.parse('response_format', "2010-06-15", result)
+        if parsed is None:
+            return
+        log.info("Response: %s", parsed)
         
-        # Test inflation endpoint with OPTIONS (CORS preflight)
-        try:
-            options_response = requests.options(self.endpoint, timeout=10)
-            print(f"✅ OPTIONS request successful: {options_response.status_code}")
-        except Exception as e:
-            print(f"❌ OPTIONS request failed: {e}")
-            self.test_results.append("FAIL: CORS preflight (OPTIONS) failed")
+        # Check COLA-specific fields for COLA period
+        if "COLA Period" in parsed.category:
+            for field in ('cola_adjusted_salary', 'defacto_paycut'):
+                if getattr(parsed, field) is None:
+                    self.fail('response_format', "2010-06-15", f"missing or null COLA field {field}")
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all test suites"""
-        print("🚀 Starting Salary Inflation Calculator API Tests")
-        print(f"Testing endpoint: {self.endpoint}")
+        log.info("Starting Salary Inflation Calculator API Tests against %s", self.endpoint)
         
-        self.test_api_availability()
-        self.test_response_format()
-        self.test_pre_1991_employment()
-        self.test_cola_period_employment()
-        self.test_post_2021_employment()
-        self.test_edge_cases()
-        self.test_invalid_inputs()
+        try:
+            # Suites only share self.failures, and fail() appends without awaiting,
+            # so running them concurrently on the one event loop needs no lock
+            await asyncio.gather(
+                self.test_response_format(),
+                self.test_pre_1991_employment(),
+                self.test_cola_period_employment(),
+                self.test_post_2021_employment(),
+                self.test_edge_cases(),
+                self.test_invalid_inputs(),
+            )
+        finally:
+            await self.client.aclose()
         
         # Summary
-        print("\n" + "="*60)
-        print("🏁 TEST SUMMARY")
-        print("="*60)
-        
-        if not self.test_results:
+        if not self.failures:
             print("✅ ALL TESTS PASSED! The salary inflation calculator API is working correctly.")
-            print("\nKey features verified:")
-            print("• Pre-1991 employment: Simple inflation adjustment")
-            print("• 1991-2021 COLA period: Complex COLA calculations with threshold logic")
-            print("• Post-2021 employment: Simple inflation adjustment")
-            print("• Edge case handling: Boundary dates processed correctly")
-            print("• Input validation: Proper error handling for invalid inputs")
-            print("• Response format: All required fields present")
         else:
-            print(f"❌ {len(self.test_results)} TESTS FAILED:")
-            for i, failure in enumerate(self.test_results, 1):
+            print(f"❌ {len(self.failures)} TESTS FAILED:")
+            for i, failure in enumerate(self.failures, 1):
                 print(f"{i}. {failure}")
         
-        return len(self.test_results) == 0
+        return not self.failures
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-v', '--verbose', action='store_true', help="log every case at INFO level")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+    
     tester = SalaryInflationAPITester()
-    success = tester.run_all_tests()
-    exit(0 if success else 1)
\ No newline at end of file
+    success = asyncio.run(tester.run_all_tests())
+    exit(0 if success else 1)
@@ -4,41 +4,155 @@ BLS Accuracy Test for Salary Inflation Calculator
 Tests specific scenarios against known BLS calculator results
 """
 
+import asyncio
+import atexit
+import bisect
+import argparse
+import functools
+import io
+import logging
+import os
 import requests
+import socket
+import sys
+import time
 import json
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # only needed for the BLS_ASYNC path
+    aiohttp = None
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # stdlib fallback when orjson is not installed
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Rough historical inflation rates: _TIER_RATES[i] applies from _TIER_YEARS[i-1]
+# up to (not including) _TIER_YEARS[i]
+_TIER_YEARS = (1990, 2000, 2010, 2020)
+_TIER_RATES = (
+    0.035,  # ~3.5% earlier periods
+    0.03,   # ~3% 1990s
+    0.025,  # ~2.5% 2000s
+    0.025,  # ~2.5% 2010s
+    0.04,   # ~4% recent years
+)
+
+_REQUIRED_FIELDS = frozenset({'inflation_adjusted_salary', 'inflation_rate', 'original_salary', 'start_date'})
+
+
+class TestCase(NamedTuple):
+    __test__ = False  # a scenario record, not a pytest test class
+
+    start_date: str
+    original_salary: float
+    expected_result: Optional[float]  # known BLS result, or None to use the rough estimate
+    description: str
+    tolerance: float
+
+    def payload(self) -> Dict[str, Any]:
+        """Request body for this scenario"""
+        return {"start_date": self.start_date, "original_salary": self.original_salary}
+
+
+# Test scenarios with expected BLS results
+_TEST_CASES = (
+    TestCase("2014-08-01", 57500, 76277, "August 2014 to December 2024 - Primary test case", 500),  # Allow $500 tolerance
+    TestCase("2020-01-01", 50000, None, "January 2020 to December 2024", 300),
+    TestCase("2010-06-01", 40000, None, "June 2010 to December 2024", 500),
+    TestCase("1995-03-01", 35000, None, "March 1995 to December 2024", 800),
+)
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def _body(response: requests.Response) -> Any:
+    """Parsed JSON body, or the raw text when the body is not JSON"""
+    try:
+        return _loads(response.content)
+    except ValueError:  # orjson.JSONDecodeError and json.JSONDecodeError both subclass it
+        return response.text
+
+
+def _decode(content: bytes) -> Any:
+    """_body for raw bytes, as read by the aiohttp path"""
+    try:
+        return _loads(content)
+    except ValueError:
+        return content.decode(errors='replace')
+
+
+_BACKEND_URL_KEY = 'REACT_APP_BACKEND_URL='
+
+
+@functools.lru_cache(maxsize=1)
+def get_backend_url() -> str:
+    """Get backend URL from frontend .env file (read once per process)"""
+    try:
+        with open('/app/frontend/.env', 'r') as f:
+            for line in f:
+                if line.startswith(_BACKEND_URL_KEY):
+                    return line[len(_BACKEND_URL_KEY):].strip()
+    except Exception as e:
+        logger.warning("Error reading frontend .env: %s", e)
+    return "http://localhost:8001"  # fallback
+
+
+def resolve_host(hostname: str, port: int) -> Tuple[str, ...]:
+    """Every address hostname resolves to, in getaddrinfo order; empty if it does not resolve"""
+    started = time.perf_counter()
+    try:
+        infos = socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        logger.warning("DNS lookup for %s failed: %s", hostname, e)
+        return ()
+    addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+    logger.info("Resolved %s -> %s in %.1f ms", hostname, ", ".join(addresses),
+                (time.perf_counter() - started) * 1000)
+    return addresses
+
 
 class BLSAccuracyTester:
     def __init__(self):
         # Get backend URL from frontend .env file
-        self.base_url = self.get_backend_url()
+        self.base_url = get_backend_url()
         self.endpoint = f"{self.base_url}/api/calculate-inflation"
+        self.batch_endpoint = f"{self.endpoint}/batch"
         self.test_results = []
+        # One keep-alive session for every call to the backend
+        self.session = requests.Session()
+        # Log how long the backend takes to resolve; keep-alive reuse keeps later lookups rare
+        backend = urlparse(self.base_url)
+        resolve_host(backend.hostname, backend.port or (443 if backend.scheme == 'https' else 80))
+        adapter = HTTPAdapter(
+            pool_connections=2, pool_maxsize=10, pool_block=True,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Responses are sub-kilobyte JSON; skip gzip so the body is parsed straight from response.content
+        self.session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'identity'})
         
-    def get_backend_url(self) -> str:
-        """Get backend URL from frontend .env file"""
-        try:
-            with open('/app/frontend/.env', 'r') as f:
-                for line in f:
-                    if line.startswith('REACT_APP_BACKEND_URL='):
-                        return line.split('=', 1)[1].strip()
-        except Exception as e:
-            print(f"Error reading frontend .env: {e}")
-        return "http://localhost:8001"  # fallback
-    
     def make_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make POST request to the inflation endpoint"""
         try:
-            response = requests.post(
-                self.endpoint,
-                json=data,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
-            )
+            response = self.session.post(self.endpoint, data=_dumps(data), headers=_JSON_HEADERS, timeout=30)
             return {
                 'status_code': response.status_code,
-                'response': response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text,
-                'success': response.status_code == 200
+                'response': _body(response),
+                'success': response.ok
             }
         except requests.exceptions.RequestException as e:
             return {
@@ -47,177 +161,253 @@ class BLSAccuracyTester:
                 'success': False
             }
     
+    def make_batch_request(self, items: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """POST all items to the batch endpoint; returns None if the server has no batch endpoint"""
+        try:
+            response = self.session.post(self.batch_endpoint, data=_dumps({"items": items}), headers=_JSON_HEADERS, timeout=30)
+        except requests.exceptions.RequestException as e:
+            return [{'status_code': None, 'response': f"Request failed: {str(e)}", 'success': False} for _ in items]
+        if response.status_code in (404, 405):
+            return None
+        body = _body(response)
+        if not response.ok:
+            return [{'status_code': response.status_code, 'response': body, 'success': False} for _ in items]
+        if not isinstance(body, list) or len(body) != len(items):
+            # A short or malformed batch must not silently skip scenarios
+            count = len(body) if isinstance(body, list) else type(body).__name__
+            reason = f"Batch returned {count} results for {len(items)} items"
+            return [{'status_code': response.status_code, 'response': reason, 'success': False} for _ in items]
+        return [{'status_code': response.status_code, 'response': item, 'success': True} for item in body]
+    
     def test_bls_accuracy_scenarios(self):
         """Test specific scenarios against known BLS calculator results"""
-        print("\n=== Testing BLS Calculator Accuracy ===")
+        logger.info("=== Testing BLS Calculator Accuracy ===")
+        
+        # Opt-in: one request per case, all in flight at once on an event loop
+        if os.getenv('BLS_ASYNC'):
+            for case, result in zip(_TEST_CASES, asyncio.run(self._arun(_TEST_CASES))):
+                self._check_case(case, result)
+            return
         
-        # Test scenarios with expected BLS results
-        test_cases = [
-            {
-                "start_date": "2014-08-01",
-                "original_salary": 57500,
-                "expected_result": 76277,
-                "description": "August 2014 to December 2024 - Primary test case",
-                "tolerance": 500  # Allow $500 tolerance
-            },
-            {
-                "start_date": "2020-01-01", 
-                "original_salary": 50000,
-                "expected_result": None,  # Will calculate expected based on CPI
-                "description": "January 2020 to December 2024",
-                "tolerance": 300
-            },
-            {
-                "start_date": "2010-06-01",
-                "original_salary": 40000, 
-                "expected_result": None,  # Will calculate expected based on CPI
-                "description": "June 2010 to December 2024",
-                "tolerance": 500
-            },
-            {
-                "start_date": "1995-03-01",
-                "original_salary": 35000,
-                "expected_result": None,  # Will calculate expected based on CPI  
-                "description": "March 1995 to December 2024",
-                "tolerance": 800
+        # All scenarios in one round trip when the server supports it
+        results = self.make_batch_request([case.payload() for case in _TEST_CASES])
+        if results is not None:
+            for case, result in zip(_TEST_CASES, results):
+                self._check_case(case, result)
+            return
+        
+        # Older servers: the calls are independent and I/O-bound, so each worker
+        # sends and checks one case; each report is logged as a single record
+        with ThreadPoolExecutor(max_workers=len(_TEST_CASES)) as executor:
+            futures = [executor.submit(self._run_case, case) for case in _TEST_CASES]
+            for future in as_completed(futures):
+                future.result()
+    
+    async def _arun(self, cases: Tuple[TestCase, ...]) -> List[Dict[str, Any]]:
+        """POST every case concurrently over one aiohttp pool; results are in case order"""
+        if aiohttp is None:
+            raise RuntimeError("BLS_ASYNC requires aiohttp")
+        
+        connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30),
+                                         headers={'Accept-Encoding': 'identity'}) as session:
+            return await asyncio.gather(*(self._acase(session, case) for case in cases))
+    
+    async def _acase(self, session, case: TestCase) -> Dict[str, Any]:
+        """Async make_request for one case"""
+        try:
+            async with session.post(self.endpoint, data=_dumps(case.payload()), headers=_JSON_HEADERS) as response:
+                body = await response.read()
+                return {
+                    'status_code': response.status,
+                    'response': _decode(body),
+                    'success': response.ok
+                }
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return {
+                'status_code': None,
+                'response': f"Request failed: {str(e)}",
+                'success': False
             }
-        ]
+    
+    def _run_case(self, case: TestCase) -> Tuple[TestCase, Dict[str, Any]]:
+        """POST and check one scenario; runs on a worker thread"""
+        result = self.make_request(case.payload())
+        self._check_case(case, result)
+        return case, result
+    
+    def _check_case(self, case: TestCase, result: Dict[str, Any]):
+        """Compare one scenario's response against its expected result"""
+        # Collect the case's report and emit it as one record: INFO when the
+        # case passed (muted by --quiet), WARNING when it failed
+        buf = io.StringIO()
+        failures: List[str] = []
+        try:
+            self._check_case_into(buf, failures, case, result)
+        finally:
+            self.test_results.extend(failures)
+            logger.log(logging.WARNING if failures else logging.INFO, "%s", buf.getvalue().rstrip("\n"))
+    
+    def _check_case_into(self, buf: io.StringIO, failures: List[str], case: TestCase, result: Dict[str, Any]):
+        """Write the case's report to buf and its failures to failures"""
+        print(f"Testing: {case.description}", file=buf)
+        print(f"Input: ${case.original_salary:,} starting {case.start_date}", file=buf)
         
-        for case in test_cases:
-            print(f"\nTesting: {case['description']}")
-            print(f"Input: ${case['original_salary']:,} starting {case['start_date']}")
+        if result['success']:
+            response = result['response']
+            calculated_result = response.get('inflation_adjusted_salary')
+            inflation_rate = response.get('inflation_rate', 0)
             
-            result = self.make_request({
-                "start_date": case["start_date"],
-                "original_salary": case["original_salary"]
-            })
+            print(f"✅ API Response received", file=buf)
+            print(f"   Calculated Result: ${calculated_result:,.2f}", file=buf)
+            print(f"   Inflation Rate: {inflation_rate*100:.2f}%", file=buf)
+            print(f"   Years Elapsed: {response.get('years_elapsed')}", file=buf)
             
-            if result['success']:
-                response = result['response']
-                calculated_result = response.get('inflation_adjusted_salary')
-                inflation_rate = response.get('inflation_rate', 0)
+            # For the primary test case, compare against known BLS result
+            if case.expected_result:
+                difference = abs(calculated_result - case.expected_result)
+                percentage_diff = (difference / case.expected_result) * 100
                 
-                print(f"✅ API Response received")
-                print(f"   Calculated Result: ${calculated_result:,.2f}")
-                print(f"   Inflation Rate: {inflation_rate*100:.2f}%")
-                print(f"   Years Elapsed: {response.get('years_elapsed')}")
+                print(f"   Expected (BLS): ${case.expected_result:,.2f}", file=buf)
+                print(f"   Difference: ${difference:,.2f} ({percentage_diff:.2f}%)", file=buf)
                 
-                # For the primary test case, compare against known BLS result
-                if case['expected_result']:
-                    difference = abs(calculated_result - case['expected_result'])
-                    percentage_diff = (difference / case['expected_result']) * 100
-                    
-                    print(f"   Expected (BLS): ${case['expected_result']:,.2f}")
-                    print(f"   Difference: ${difference:,.2f} ({percentage_diff:.2f}%)")
-                    
-                    if difference <= case['tolerance']:
-                        print(f"✅ ACCURACY TEST PASSED - Within ${case['tolerance']} tolerance")
-                    else:
-                        print(f"❌ ACCURACY TEST FAILED - Exceeds ${case['tolerance']} tolerance")
-                        self.test_results.append(f"FAIL: BLS accuracy test - {case['description']} - difference ${difference:,.2f}")
+                if difference <= case.tolerance:
+                    print(f"✅ ACCURACY TEST PASSED - Within ${case.tolerance} tolerance", file=buf)
                 else:
-                    # For other cases, verify the calculation makes sense
-                    expected_rough = self.estimate_inflation_result(case['start_date'], case['original_salary'])
-                    rough_difference = abs(calculated_result - expected_rough)
-                    rough_percentage = (rough_difference / expected_rough) * 100
-                    
-                    print(f"   Rough Expected: ${expected_rough:,.2f}")
-                    print(f"   Difference: ${rough_difference:,.2f} ({rough_percentage:.2f}%)")
-                    
-                    if rough_percentage <= 10:  # Allow 10% variance for rough estimates
-                        print("✅ REASONABLENESS TEST PASSED")
-                    else:
-                        print("❌ REASONABLENESS TEST FAILED - Result seems unreasonable")
-                        self.test_results.append(f"FAIL: Reasonableness test - {case['description']} - {rough_percentage:.1f}% variance")
-                
-                # Verify response structure
-                required_fields = ['inflation_adjusted_salary', 'inflation_rate', 'original_salary', 'start_date']
-                for field in required_fields:
-                    if field not in response:
-                        print(f"❌ Missing required field: {field}")
-                        self.test_results.append(f"FAIL: Missing field {field} in response")
-                        
+                    print(f"❌ ACCURACY TEST FAILED - Exceeds ${case.tolerance} tolerance", file=buf)
+                    failures.append(f"FAIL: BLS accuracy test - {case.description} - difference ${difference:,.2f}")
             else:
-                print(f"❌ Request failed: {result['response']}")
-                self.test_results.append(f"FAIL: BLS accuracy test - request failed for {case['description']}")
+                # For other cases, verify the calculation makes sense
+                expected_rough = self.estimate_inflation_result(case.start_date, case.original_salary)
+                rough_difference = abs(calculated_result - expected_rough)
+                rough_percentage = (rough_difference / expected_rough) * 100
+                
+                print(f"   Rough Expected: ${expected_rough:,.2f}", file=buf)
+                print(f"   Difference: ${rough_difference:,.2f} ({rough_percentage:.2f}%)", file=buf)
+                
+                if rough_percentage <= 10:  # Allow 10% variance for rough estimates
+                    print("✅ REASONABLENESS TEST PASSED", file=buf)
+                else:
+                    print("❌ REASONABLENESS TEST FAILED - Result seems unreasonable", file=buf)
+                    failures.append(f"FAIL: Reasonableness test - {case.description} - {rough_percentage:.1f}% variance")
+            
+            # Verify response structure
+            missing = _REQUIRED_FIELDS.difference(response)
+            if missing:
+                fields = ", ".join(sorted(missing))
+                print(f"❌ Missing required fields: {fields}", file=buf)
+                failures.append(f"FAIL: Missing fields {fields} in response")
+                    
+        else:
+            print(f"❌ Request failed: {result['response']}", file=buf)
+            failures.append(f"FAIL: BLS accuracy test - request failed for {case.description}")
     
-    def estimate_inflation_result(self, start_date: str, original_salary: float) -> float:
-        """Rough estimation for comparison purposes"""
-        from datetime import datetime
-        
-        start_year = datetime.strptime(start_date, '%Y-%m-%d').year
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def estimate_inflation_result(start_date: str, original_salary: float) -> float:
+        """Rough estimation for comparison purposes (pure, so memoized per input)"""
+        start_year = int(start_date[:4])  # ISO 'YYYY-MM-DD'
         current_year = 2024
         years_elapsed = current_year - start_year
         
-        # Rough historical inflation rates
-        if start_year >= 2020:
-            avg_inflation = 0.04  # ~4% recent years
-        elif start_year >= 2010:
-            avg_inflation = 0.025  # ~2.5% 2010s
-        elif start_year >= 2000:
-            avg_inflation = 0.025  # ~2.5% 2000s
-        elif start_year >= 1990:
-            avg_inflation = 0.03   # ~3% 1990s
-        else:
-            avg_inflation = 0.035  # ~3.5% earlier periods
-            
+        avg_inflation = _TIER_RATES[bisect.bisect_right(_TIER_YEARS, start_year)]
+        
         # Compound inflation calculation
         total_inflation = (1 + avg_inflation) ** years_elapsed - 1
         return original_salary * (1 + total_inflation)
     
     def test_api_connectivity(self):
         """Test basic API connectivity"""
-        print("\n=== Testing API Connectivity ===")
+        logger.info("=== Testing API Connectivity ===")
         
         try:
-            # Test root endpoint
-            root_response = requests.get(f"{self.base_url}/api/", timeout=10)
+            # Test root endpoint; this also opens the pooled keep-alive
+            # connection that the scenario requests then reuse
+            started = time.perf_counter()
+            root_response = self.session.get(f"{self.base_url}/api/", timeout=10)
+            elapsed_ms = (time.perf_counter() - started) * 1000
             if root_response.status_code == 200:
-                print("✅ API endpoint accessible")
+                logger.info("✅ API endpoint accessible (%.1f ms, connection warmed)", elapsed_ms)
                 return True
             else:
-                print(f"❌ API endpoint returned {root_response.status_code}")
+                logger.error("❌ API endpoint returned %s (%.1f ms)", root_response.status_code, elapsed_ms)
                 self.test_results.append("FAIL: API endpoint not accessible")
                 return False
         except Exception as e:
-            print(f"❌ API connectivity failed: {e}")
+            logger.error("❌ API connectivity failed: %s", e)
             self.test_results.append("FAIL: API connectivity failed")
             return False
     
+    def close(self):
+        """Release the pooled connections"""
+        self.session.close()
+    
     def run_bls_accuracy_tests(self):
         """Run BLS accuracy verification tests"""
-        print("🎯 Starting BLS Calculator Accuracy Verification")
-        print(f"Testing endpoint: {self.endpoint}")
-        print("="*60)
+        # The tester may be shared across runs; only report this run's failures
+        self.test_results = []
+        logger.info("🎯 Starting BLS Calculator Accuracy Verification")
+        logger.info("Testing endpoint: %s", self.endpoint)
+        logger.info("=" * 60)
         
         # Test connectivity first
         if not self.test_api_connectivity():
-            print("❌ Cannot proceed - API not accessible")
+            logger.error("❌ Cannot proceed - API not accessible")
             return False
         
         # Run accuracy tests
         self.test_bls_accuracy_scenarios()
         
         # Summary
-        print("\n" + "="*60)
-        print("🏁 BLS ACCURACY TEST SUMMARY")
-        print("="*60)
+        logger.info("=" * 60)
+        logger.info("🏁 BLS ACCURACY TEST SUMMARY")
+        logger.info("=" * 60)
         
         if not self.test_results:
-            print("✅ ALL BLS ACCURACY TESTS PASSED!")
-            print("\nKey verification points:")
-            print("• August 2014 calculation matches BLS calculator (~$76,277)")
-            print("• All test scenarios produce reasonable inflation adjustments")
-            print("• API response format includes all required fields")
-            print("• Inflation rates and calculations appear accurate")
+            logger.info("✅ ALL BLS ACCURACY TESTS PASSED!")
+            logger.info("Key verification points:")
+            logger.info("• August 2014 calculation matches BLS calculator (~$76,277)")
+            logger.info("• All test scenarios produce reasonable inflation adjustments")
+            logger.info("• API response format includes all required fields")
+            logger.info("• Inflation rates and calculations appear accurate")
             return True
         else:
-            print(f"❌ {len(self.test_results)} BLS ACCURACY TESTS FAILED:")
+            logger.error("❌ %d BLS ACCURACY TESTS FAILED:", len(self.test_results))
             for i, failure in enumerate(self.test_results, 1):
-                print(f"{i}. {failure}")
+                logger.error("%d. %s", i, failure)
             return False
 
+_SINGLETON: Optional[BLSAccuracyTester] = None
+
+
+def get_tester() -> BLSAccuracyTester:
+    """Shared tester, so repeated runs reuse one connection pool"""
+    global _SINGLETON
+    if _SINGLETON is None:
+        _SINGLETON = BLSAccuracyTester()
+    return _SINGLETON
+
+
+@atexit.register
+def _close_tester():
+    if _SINGLETON is not None:
+        _SINGLETON.close()
+
+
 if __name__ == "__main__":
-    tester = BLSAccuracyTester()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--quiet', action='store_true', help="only report failures (same as BLS_LOG=WARNING)")
+    args = parser.parse_args()
+    level_name = os.getenv('BLS_LOG', 'INFO').upper()
+    # getLevelName maps a known name to its number and anything else to a "Level ..." string
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.basicConfig(level=logging.WARNING if args.quiet else level,
+                        format='%(message)s', stream=sys.stdout)
+    if level_name != logging.getLevelName(level):
+        logger.warning("Unknown BLS_LOG level %r; using INFO", level_name)
+    
+    tester = get_tester()
     success = tester.run_bls_accuracy_tests()
     exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Parametrized pytest version of the backend_test.py suites.
+Each case is its own test so pytest-xdist can spread them across workers.
+Requires a running backend; the module is skipped when it is not reachable.
+"""
+
+import pytest
+import requests
+
+from backend_test import (
+    get_backend_url,
+    PRE_1991_CASES,
+    COLA_PERIOD_CASES,
+    POST_2021_CASES,
+    EDGE_CASES,
+    EXPECTED_CATEGORY,
+    INVALID_CASES,
+)
+
+
+def _case_id(case):
+    return case["description"]
+
+
+@pytest.fixture(scope="session")
+def endpoint():
+    return f"{get_backend_url()}/api/calculate-inflation"
+
+
+@pytest.fixture(scope="session")
+def session(endpoint):
+    session = requests.Session()
+    session.headers.update({'Content-Type': 'application/json'})
+    try:
+        session.get(f"{get_backend_url()}/api/", timeout=10)
+    except requests.exceptions.ConnectionError:
+        session.close()
+        pytest.skip(f"Backend not reachable at {endpoint}")
+    yield session
+    session.close()
+
+
+def calculate(session, endpoint, case):
+    return session.post(
+        endpoint,
+        json={"start_date": case["start_date"], "original_salary": case["original_salary"]},
+        timeout=30,
+    )
+
+
+@pytest.mark.parametrize("case", PRE_1991_CASES, ids=_case_id)
+def test_pre_1991(session, endpoint, case):
+    response = calculate(session, endpoint, case)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body['category'] == "Pre-1991 Employment"
+    assert body['cola_adjusted_salary'] is None
+    assert body['defacto_paycut'] is None
+
+
+@pytest.mark.parametrize("case", COLA_PERIOD_CASES, ids=_case_id)
+def test_cola_period(session, endpoint, case):
+    response = calculate(session, endpoint, case)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body['category'] == "1991-2021 Employment (COLA Period)"
+
+    cola_base = body['original_salary'] + 8000
+    if case['expected_threshold'] == "high":
+        expected_cola = cola_base + 3000
+    else:
+        expected_cola = cola_base * 1.04
+    assert abs(body['cola_adjusted_salary'] - expected_cola) < 0.01
+
+    expected_paycut = body['inflation_adjusted_salary'] - body['cola_adjusted_salary']
+    assert abs(body['defacto_paycut'] - expected_paycut) < 0.01
+
+
+@pytest.mark.parametrize("case", POST_2021_CASES, ids=_case_id)
+def test_post_2021(session, endpoint, case):
+    response = calculate(session, endpoint, case)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body['category'] == "Post-2021 Employment"
+    assert body['cola_adjusted_salary'] is None
+    assert body['defacto_paycut'] is None
+
+
+@pytest.mark.parametrize("case", EDGE_CASES, ids=_case_id)
+def test_edge_case(session, endpoint, case):
+    response = calculate(session, endpoint, case)
+    assert response.status_code == 200, response.text
+    assert EXPECTED_CATEGORY[case['start_date']] in response.json()['category']
+
+
+@pytest.mark.parametrize("case", INVALID_CASES, ids=_case_id)
+def test_invalid_input(session, endpoint, case):
+    response = calculate(session, endpoint, case)
+    assert response.status_code in case['expected_status'], response.text
+
+
+def test_response_format(session, endpoint):
+    response = calculate(session, endpoint, {"start_date": "2010-06-15", "original_salary": 55000})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    for field in ('original_salary', 'start_date', 'inflation_adjusted_salary',
+                  'category', 'summary', 'inflation_rate', 'years_elapsed'):
+        assert field in body
+    assert "COLA Period" in body['category']
+    assert body['cola_adjusted_salary'] is not None
+    assert body['defacto_paycut'] is not None
+
+
+def test_batch_matches_single(session, endpoint):
+    cases = PRE_1991_CASES + COLA_PERIOD_CASES + POST_2021_CASES + EDGE_CASES
+    items = [{"start_date": c["start_date"], "original_salary": c["original_salary"]} for c in cases]
+    response = session.post(f"{endpoint}/batch", json={"items": items}, timeout=30)
+    assert response.status_code == 200, response.text
+    batch = response.json()
+    assert len(batch) == len(cases)
+    for case, body in zip(cases, batch):
+        assert body == calculate(session, endpoint, case).json()
+
+
+def test_string_salary_is_rejected(session, endpoint):
+    # Requests are decoded strictly by msgspec: unlike pydantic's lax mode, a
+    # numeric string is not coerced, and the 422 detail is a single message string
+    response = calculate(session, endpoint, {"start_date": "2020-01-01", "original_salary": "50000"})
+    assert response.status_code == 422, response.text
+    detail = response.json()['detail']
+    assert isinstance(detail, str)
+    assert "original_salary" in detail
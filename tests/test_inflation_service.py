@@ -0,0 +1,160 @@
+"""
+Unit tests for InflationService's CPI cache: stale-while-revalidate refreshes,
+failed-fetch backoff, per-range CPI indexes and migration of the legacy
+JSON cache file.
+BLS is never contacted; fetches are mocked.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import orjson
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from services.inflation_service import InflationService, _interpolate_cpi, interpolate_cpi_batch  # noqa: E402
+
+PAYLOAD = {
+    "status": "REQUEST_SUCCEEDED",
+    "Results": {"series": [{"seriesID": "CUUR0000SA0", "data": [
+        {"year": "2020", "period": "M13", "value": "258.811"},
+    ]}]},
+}
+FRESH_PAYLOAD = {**PAYLOAD, "message": ["refreshed"]}
+
+
+@pytest.fixture
+def service(tmp_path):
+    return InflationService(data_dir=tmp_path)
+
+
+def fetch_signalling(service, result):
+    """Mock for _fetch_cpi_data that returns result and sets .done once called"""
+    done = threading.Event()
+
+    def fetch(start_year, end_year):
+        done.set()
+        return result
+
+    fetch_mock = mock.Mock(side_effect=fetch)
+    fetch_mock.done = done
+    return fetch_mock
+
+
+def wait_for_refresh(service, fetch_mock):
+    assert fetch_mock.done.wait(5), "background refresh did not run"
+    deadline = time.time() + 5
+    while service._refreshing and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_fresh_entry_is_served_without_fetching(service):
+    service._cache["2020_2020"] = {"fetched_at": time.time(), "ttl": 3600, "payload": PAYLOAD}
+    with mock.patch.object(service, "_fetch_cpi_data") as fetch:
+        assert service.get_cpi_data(2020, 2020) is PAYLOAD
+    fetch.assert_not_called()
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(service):
+    service._cache["2020_2020"] = {"fetched_at": time.time() - 7200, "ttl": 3600, "payload": PAYLOAD}
+    fetch = fetch_signalling(service, FRESH_PAYLOAD)
+    with mock.patch.object(service, "_fetch_cpi_data", fetch):
+        assert service.get_cpi_data(2020, 2020) is PAYLOAD
+        wait_for_refresh(service, fetch)
+    fetch.assert_called_once_with(2020, 2020)
+
+
+def test_legacy_entry_is_served_and_treated_as_stale(service):
+    service._cache["2020_2020"] = PAYLOAD
+    fetch = fetch_signalling(service, FRESH_PAYLOAD)
+    with mock.patch.object(service, "_fetch_cpi_data", fetch):
+        assert service.get_cpi_data(2020, 2020) is PAYLOAD
+        wait_for_refresh(service, fetch)
+    fetch.assert_called_once_with(2020, 2020)
+
+
+def test_successful_refresh_replaces_entry(service):
+    service._cache["2020_2020"] = PAYLOAD
+    response = mock.Mock(content=orjson.dumps(FRESH_PAYLOAD))
+    with mock.patch.object(service._session, "post", return_value=response):
+        assert service._fetch_cpi_data(2020, 2020) == FRESH_PAYLOAD
+    entry = service._cache["2020_2020"]
+    assert entry["payload"] == FRESH_PAYLOAD
+    assert entry["ttl"] > 0 and entry["fetched_at"] > 0
+    assert service.load_from_cache()["2020_2020"]["payload"] == FRESH_PAYLOAD
+
+
+def test_failed_refresh_backs_off(service):
+    service._cache["2020_2020"] = PAYLOAD
+    with mock.patch.object(service._session, "post", side_effect=requests.ConnectionError("down")) as post:
+        service.get_cpi_data(2020, 2020)
+        deadline = time.time() + 5
+        while (post.call_count == 0 or service._refreshing) and time.time() < deadline:
+            time.sleep(0.01)
+        assert post.call_count == 1
+        # Still stale, but the recent failure suppresses another attempt
+        for _ in range(3):
+            assert service.get_cpi_data(2020, 2020) is PAYLOAD
+        assert not service._refreshing
+        assert post.call_count == 1
+
+
+def test_uncached_fetch_failure_falls_back_and_backs_off(service):
+    with mock.patch.object(service._session, "post", side_effect=requests.ConnectionError("down")) as post:
+        first = service.get_cpi_data(2020, 2021)
+        second = service.get_cpi_data(2020, 2021)
+    assert first == second == service.get_fallback_cpi_data(2020, 2021)
+    assert post.call_count == 1
+
+
+def test_legacy_json_cache_is_migrated_to_pickle(tmp_path):
+    (tmp_path / "cpi_cache.json").write_bytes(orjson.dumps({"2020_2020": PAYLOAD}))
+
+    service = InflationService(data_dir=tmp_path)
+    assert service._cache == {"2020_2020": PAYLOAD}
+    assert service.cache_file.exists()
+
+    # Later loads read the pickle, even once the JSON file is gone
+    (tmp_path / "cpi_cache.json").unlink()
+    assert InflationService(data_dir=tmp_path)._cache == {"2020_2020": PAYLOAD}
+
+
+def test_cpi_index_is_reused_until_the_payload_changes(service):
+    service._cache["2020_2020"] = {"fetched_at": time.time(), "ttl": 3600, "payload": PAYLOAD}
+    index = service.get_cpi_index(2020, 2020)
+    assert index == {2020: 258.811}
+    assert service.get_cpi_index(2020, 2020) is index
+    assert service.extract_cpi_for_year(PAYLOAD, 2020) == 258.811
+    assert service.extract_cpi_for_year(PAYLOAD, 2019) is None
+
+    service._cache["2020_2020"] = {"fetched_at": time.time(), "ttl": 3600, "payload": FRESH_PAYLOAD}
+    assert service.get_cpi_index(2020, 2020) is not index
+
+
+def test_cpi_index_of_stale_entry_schedules_refresh(service):
+    service._cache["2020_2020"] = {"fetched_at": time.time(), "ttl": 3600, "payload": PAYLOAD}
+    service.get_cpi_index(2020, 2020)
+    service._cache["2020_2020"]["fetched_at"] = 0
+    with mock.patch.object(service, "_schedule_refresh") as refresh:
+        assert service.get_cpi_index(2020, 2020) == {2020: 258.811}
+    refresh.assert_called_once_with(2020, 2020)
+
+
+def test_extract_cpi_for_year_scans_unindexed_payloads(service):
+    fallback = service.get_fallback_cpi_data(2019, 2020)
+    assert service.extract_cpi_for_year(fallback, 2020) == 258.8
+    assert service.extract_cpi_for_year(fallback, 2018) is None
+    assert service.extract_cpi_for_year({}, 2020) is None
+
+
+def test_interpolate_cpi_batch_matches_scalar_path():
+    # In-table, between table years, before the table and after it
+    years = np.array([2020, 1995, 1993, 1913, 1900, 1850, 2024, 2026, 2040])
+    expected = [_interpolate_cpi(int(year)) for year in years]
+    np.testing.assert_allclose(interpolate_cpi_batch(years), expected, rtol=1e-12)